@@ -1,7 +1,39 @@
+import io
 import json
+import logging
+import os
 import re
+import shutil
+import tempfile
+import threading
 import yaml
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+
+# prefer LibYAML's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# prefer orjson for parsing large Vale JSON output, if installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger("vale-edit")
+
+# max threads for editing files concurrently
+_MAX_WORKERS = 8
+# max read buffer per Markdown file (1 MiB)
+_MAX_READ_BUFFER = 1 << 20
+
+# sort/group key for Vale revisions
+_LINE_KEY = itemgetter("Line")
+# sort key for decorated span revisions (start first)
+_SPAN_START_KEY = itemgetter(0)
 
 
 """
@@ -9,118 +41,184 @@ Python script to automate Markdown edits using Vale's JSON output
 Overwrites original Markdown file with edited file
 
 Users must change these variables to accomodate local projects:
-    - all "variables for rules" inside apply_edits()
+    - all "variables for rules" below
     - json_file_path and vale_dir at end of script
+
+Set VALE_EDIT_VERBOSE=1 to print each individual revision
 """
 
 
-def edit_contractions(line: str, start: int, end: int, replacement: str) -> str:
+# variables for rules
+# EX: "Google.Spacing"
+whitespace_rule = "style.rule"
+eol_rule = "style.rule"
+contraction_rule = "style.rule"
+special_words_rule = "style.rule" # EX: "Google.WordList"
+head_punct_rule = "style.rule"
+head_case_rule = "style.rule"
+# path to Headings.yml with exceptions list header sentence-style casing
+# EX: .vale/style/Google/Headers.yml
+exceptions_yml = '.vale/style/styleguide/rule.yml'
+
+# GLOBAL = edit modifies whole line
+_GLOBAL_RULES = {
+    whitespace_rule,
+    eol_rule}
+# SPAN = edit modifies only content with index span
+_SPAN_RULES = {
+    contraction_rule,
+    special_words_rule,
+    head_punct_rule,
+    head_case_rule
+}
+# any rule this script can revise
+_KNOWN_RULES = _SPAN_RULES | _GLOBAL_RULES
+
+
+# precompiled pattern for edit_spacing()
+# punctuation with any surrounding spaces
+_RE_SPACE_PUNCT = re.compile(r' *([.,:;?!])( *)')
+_PUNCT = frozenset('.,:;?!')
+_NO_SPACE_AFTER = frozenset(' \n\t.,:;?!*')
+
+
+def _sub_spacing(match):
+    """
+    Rewrite one punctuation match in edit_spacing()
+
+    Only used in edit_spacing()
+    """
+    punct = match.group(1)
+    end = match.end()
+    next_char = match.string[end:end + 1]
+    # no space before end of line or following punctuation
+    if not next_char or next_char in _PUNCT:
+        return punct
+    # collapse existing spaces to one
+    if match.group(2):
+        return punct + ' '
+    if next_char in _NO_SPACE_AFTER:
+        return punct
+    return punct + ' '
+
+
+def edit_contractions(segment: str, replacement: str) -> str:
     """
     Replace expanded word/phrase with contraction
 
     Parameters:
-        line (str) -- line from input Markdown
-        start (int) -- edit start index
-        end (int) -- edit end index
+        segment (str) -- span content from input Markdown line
         replacement (str) -- contraction
     Returns:
-        str -- input line with contraction
+        str -- revised segment (contraction)
     """
-    start -= 1
-    orig_word = line[start:end]
-    print(f"\t\t\tOriginal word: '{orig_word}'\n\t\t\tReplacement:'{replacement}'")
-    revised_line = line[:start] + replacement + line[end:]
-    return revised_line
+    if segment == replacement:
+        return segment
+    log.debug("\t\t\tOriginal word: '%s'\n\t\t\tReplacement:'%s'", segment, replacement)
+    return replacement
 
 
-def edit_special_words(line: str, start: int, end: int, replacement: str) -> str:
+def edit_special_words(segment: str, replacement: str) -> str:
     """
     Replace OOV word/phrase with in-style word/phrase
 
     Parameters:
-        line (str) -- line from input Markdown
-        start (int) -- edit start index
-        end (int) -- edit end index
+        segment (str) -- span content from input Markdown line
         replacement (str) -- correct term
     Returns:
-        str -- input line with replaced word
+        str -- revised segment (correct term)
     """
-    start -= 1
-    orig_word = line[start:end]
-    print(f"\t\t\tOriginal word: '{orig_word}'\n\t\t\tReplacement:'{replacement}'")
-    revised_line = line[:start] + replacement + line[end:]
-    return revised_line
+    if segment == replacement:
+        return segment
+    log.debug("\t\t\tOriginal word: '%s'\n\t\t\tReplacement:'%s'", segment, replacement)
+    return replacement
 
 
-def edit_header_punct(line: str, start: int, end: int) -> str:
+def edit_header_punct(header_seg: str) -> str:
     """
     Remove punctuation from headers
 
     Parameters:
-        line (str) -- line from input Markdown
-        start (int) -- edit start index
-        end (int) -- edit end index
+        header_seg (str) -- span content from input Markdown line
     Returns:
-        str -- input line sans punctuation
+        str -- revised segment sans punctuation
+    """
+    if not header_seg or header_seg[-1] not in '.,;:!?':
+        return header_seg
+    return header_seg.rstrip('.,;:!?')
+
+
+# parsed .yml exceptions per path: (mtime, size, exceptions, pattern)
+_YML_CACHE = {}
+
+
+def _compile_exceptions(exceptions):
+    """
+    Compile exceptions into one alternation (longest first)
+    Matches whole words/phrases only; None if no exceptions
+
+    Only used in _load_exceptions()
     """
-    start -= 1
-    header_seg = line[start:end]
-    revised_seg = header_seg.rstrip('.,;:!?')
-    revised_line = line[:start] + revised_seg + line[end:]
-    return revised_line
+    if not exceptions:
+        return None
+    words = sorted((str(word) for word in exceptions), key=len, reverse=True)
+    return re.compile(r'(?<!\w)(' + '|'.join(map(re.escape, words)) + r')(?!\w)')
 
 
 def _load_exceptions(yml_file):
     """
-    Load .yml file with 'exceptions' list
+    Load .yml file with 'exceptions' list as a frozenset
+    plus a compiled pattern matching any exception
+    Cached per path until the file's mtime or size changes
 
     Only used in edit_headcase()
     """
     try:
+        stat = os.stat(yml_file)
+        cached = _YML_CACHE.get(yml_file)
+        if cached and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2:]
         with open(yml_file, 'r', encoding='utf-8') as file:
-            rule = yaml.safe_load(file)
-        return rule.get('exceptions', [])
+            rule = yaml.load(file, Loader=_SafeLoader)
+        exceptions = frozenset(rule.get('exceptions', []))
+        pattern = _compile_exceptions(exceptions)
+        _YML_CACHE[yml_file] = (stat.st_mtime, stat.st_size, exceptions, pattern)
+        return exceptions, pattern
     except FileNotFoundError:
-        print(f"\t\t\tUnable to find YML at {yml_file}.")
-        return []
+        log.warning("\t\t\tUnable to find YML at %s.", yml_file)
+        return frozenset(), None
     except Exception as err:
-        print(f"\t\t\tUnable to load YML at {yml_file}: {err}")
-        return []
+        log.warning("\t\t\tUnable to load YML at %s: %s", yml_file, err)
+        return frozenset(), None
 
 
-def edit_headcase(line: str, start: int, end: int, yml_file: str) -> str:
+def edit_headcase(orig_head: str, yml_file: str) -> str:
     """
     Convert header to sentence casing (exclude exceptions)
 
     Parameters:
-        line (str) -- line from input Markdown
-        start (int) -- edit start index
-        end (int) -- edit end index
+        orig_head (str) -- span content from input Markdown line
         yml_file (str) -- path to .yml file with 'exceptions' list
     Returns:
-        str -- input line with sentence casing
+        str -- revised segment with sentence casing
     """
-    exceptions = _load_exceptions(yml_file)
+    _, pattern = _load_exceptions(yml_file)
 
-    start -= 1
-    orig_head = line[start:end]
-    words = orig_head.split()
-    revised_words = []
+    # alternating [text, exception, text, ...]
+    parts = pattern.split(orig_head) if pattern else [orig_head]
+    # lowercase all non-exception text
+    parts[::2] = [part.lower() for part in parts[::2]]
 
-    for i, word in enumerate(words):
-        if word in exceptions:
-            revised_words.append(word)
-        # capitalize first word of header
-        elif i == 0:
-            revised_words.append(word.capitalize())
-        # lowercase following non-exceptions
-        else:
-            revised_words.append(word.lower())
+    # capitalize first word of header (unless an exception)
+    first = parts[0]
+    stripped = first.lstrip()
+    if stripped:
+        i = len(first) - len(stripped)
+        parts[0] = first[:i] + first[i].upper() + first[i + 1:]
 
-    revised_head = ' '.join(revised_words)
-    print(f"\t\t\tOriginal header: '{orig_head}'\n\t\t\tRevised header: '{revised_head}'")
-    revised_line = line[:start] + revised_head + line[end:]
-    return revised_line
+    revised_head = ''.join(parts)
+    log.debug("\t\t\tOriginal header: '%s'\n\t\t\tRevised header: '%s'", orig_head, revised_head)
+    return revised_head
 
 
 def edit_spacing(line: str, start: int, end: int) -> str:
@@ -135,9 +233,10 @@ def edit_spacing(line: str, start: int, end: int) -> str:
     Returns:
         str -- input line sans punctuation
     """
-    line = re.sub(r' +([.,:;?!])', r'\1', line)
-    line = re.sub(r'([.,:;?!])(?![ \n\t.,:;?!*]|\Z)', r'\1 ', line)
-    line = re.sub(r'([.,:;?!]) +', r'\1 ', line)
+    # nothing to respace without punctuation
+    if _PUNCT.isdisjoint(line):
+        return line.strip()
+    line = _RE_SPACE_PUNCT.sub(_sub_spacing, line)
     return line.strip()
 
 
@@ -156,160 +255,299 @@ def edit_eol_whitespace(line: str, start: int, end: int) -> str:
     return line.rstrip()
 
 
+def _replacement(revision):
+    """
+    First Action Param of a revision (None if missing)
+    Logs a warning when missing
+
+    Only used by span revision adapters
+    """
+    params = (revision.get("Action") or {}).get("Params")
+    if params:
+        return params[0]
+    log.warning("\t\t\tMissing replacement Params for %s. Skipping.", revision.get("Check"))
+    return None
+
+
+def _apply_contraction(segment, revision):
+    """
+    Span adapter for edit_contractions()
+    """
+    replacement = _replacement(revision)
+    if replacement is None:
+        return segment
+    return edit_contractions(segment, replacement)
+
+
+def _apply_special_words(segment, revision):
+    """
+    Span adapter for edit_special_words()
+    """
+    replacement = _replacement(revision)
+    if replacement is None:
+        return segment
+    return edit_special_words(segment, replacement)
+
+
+def _apply_header_punct(segment, revision):
+    """
+    Span adapter for edit_header_punct()
+    """
+    return edit_header_punct(segment)
+
+
+def _apply_headcase(segment, revision):
+    """
+    Span adapter for edit_headcase()
+    """
+    return edit_headcase(segment, exceptions_yml)
+
+
+# dict to match span .yml rule (key) with adapter (value)
+# adapter(segment, revision) -> revised segment
+_SPAN_DISPATCH = {
+    contraction_rule: _apply_contraction,
+    special_words_rule: _apply_special_words,
+    head_punct_rule: _apply_header_punct,
+    head_case_rule: _apply_headcase
+}
+
+
+def _process_file(file_path, revisions):
+    """
+    Apply revisions to one Markdown file and overwrite it if revised
+
+    Only used in apply_edits()
+    """
+    log.info("\nEditing file %s", file_path)
+
+    # only revisions for known rules; skip the file if none are left
+    useful = []
+    unknown = set()
+    for revision in revisions:
+        check = revision.get("Check")
+        if check in _KNOWN_RULES:
+            if revision.get("Line") is not None:
+                useful.append(revision)
+        elif check:
+            unknown.add(check)
+    for check in sorted(unknown):
+        log.debug("\tUnable to apply revisions for %s. Skipping.", check)
+    if not useful:
+        log.info("\tNo actionable revisions for %s", file_path)
+        return
+
+    try:
+        # readlines() splits on '\n' only, matching Vale's line numbers
+        # (str.splitlines() also breaks on '\f', '\v', U+2028, etc.)
+        # read buffer sized to the file (default minimum, 1 MiB maximum)
+        size = os.path.getsize(file_path)
+        buffering = max(io.DEFAULT_BUFFER_SIZE, min(size, _MAX_READ_BUFFER))
+        with open(file_path, 'r', encoding='utf-8', buffering=buffering) as file:
+            content = file.readlines()
+    except FileNotFoundError:
+        log.warning("\tUnable to find %s. Skipping.", file_path)
+        return
+    except Exception:
+        log.warning("\tUnable to read %s. Skipping.", file_path)
+        return
+
+    modified = False
+    # group revisions by line (stable sort keeps JSON order per line)
+    useful.sort(key=_LINE_KEY)
+
+    for line_num, line_revisions in groupby(useful, key=_LINE_KEY):
+        line_num -= 1 # 0-based index
+        if line_num < 0 or line_num >= len(content):
+            log.warning("\t\tUnable to find line %d. Skipping.", line_num + 1)
+            continue
+
+        current_line = content[line_num]
+
+        log.debug("\tEditing line %d:", line_num + 1)
+
+        # separate revision rules span vs. global per JSON "Check" key
+        span_checks = []
+        global_checks = set()
+        for revision in line_revisions:
+             check = revision.get("Check")
+             if check in _SPAN_RULES:
+                 span = revision.get("Span")
+                 if span:
+                     # decorate once: (start, end, check, revision)
+                     span_checks.append((span[0], span[1], check, revision))
+             elif check in _GLOBAL_RULES:
+                 global_checks.add(check)
+
+        # span revisions (the last shall be first)
+        span_checks.sort(key=_SPAN_START_KEY, reverse=True)
+
+        # revised segments right-to-left, joined once per line
+        parts = []
+        cursor = len(current_line)
+        for start, end, check, revision in span_checks:
+            func = _SPAN_DISPATCH.get(check)
+            if not func: continue
+
+            # Vale spans are 1-based, inclusive character (not byte) offsets,
+            # so lines stay str rather than encoded bytearrays
+            seg_start = start - 1
+            # span overlaps an earlier revision: splice so it sees revised text
+            if end > cursor and parts:
+                current_line = current_line[:cursor] + ''.join(reversed(parts))
+                parts = []
+                cursor = len(current_line)
+
+            log.debug("\t\tApply local revision %s at %s-%s", check, start, end)
+            segment = current_line[seg_start:end]
+            try:
+                revised_seg = func(segment, revision)
+            except Exception as err:
+                log.warning("\t\t\tError for %s: %s", check, err)
+                continue
+
+            # nothing to splice
+            if revised_seg == segment: continue
+
+            parts.append(current_line[end:cursor])
+            parts.append(revised_seg)
+            cursor = seg_start
+
+        if parts:
+            parts.append(current_line[:cursor])
+            current_line = ''.join(reversed(parts))
+
+        # now global line revision
+        if whitespace_rule in global_checks:
+            log.debug("\t\tApply global line revision %s", whitespace_rule)
+            try:
+                # dummy spans (0,0)
+                current_line = edit_spacing(current_line, 0, 0)
+            except Exception as err:
+                log.warning("\t\t\tError for %s: %s", whitespace_rule, err)
+
+        if eol_rule in global_checks:
+            log.debug("\t\tApply global line revision %s", eol_rule)
+            try:
+                # dummy spans (0,0)
+                current_line = edit_eol_whitespace(current_line, 0, 0)
+            except Exception as err:
+                log.warning("\t\t\tError for %s: %s", eol_rule, err)
+
+        # line break check
+        if not current_line.endswith('\n') and content[line_num].endswith('\n'):
+             current_line += '\n'
+
+        if current_line != content[line_num]:
+            content[line_num] = current_line
+            modified = True
+
+    if not modified:
+        log.info("\tNo revisions applied to %s", file_path)
+        return
+
+    # write over original file atomically via temp file in the same dir
+    target = os.path.realpath(file_path)
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.vale-edit-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(''.join(content))
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+        log.info("\tCompleted revisions for %s", file_path)
+    except Exception as err:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        log.error("\tError writing revisions to %s: %s", file_path, err)
+
+
+# per-thread list of held log records (None = emit directly)
+_thread_records = threading.local()
+
+
+class _RecordBuffer(logging.Filter):
+    """
+    Hold log records from worker threads that have a buffer set
+    so each file's output is emitted together, in order
+
+    Only used in apply_edits()
+    """
+    def filter(self, record):
+        records = getattr(_thread_records, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
+
+log.addFilter(_RecordBuffer())
+
+
+def _process_file_buffered(file_path, revisions):
+    """
+    Run _process_file() and return its log records instead of emitting them
+
+    Only used in apply_edits()
+    """
+    _thread_records.records = records = []
+    try:
+        _process_file(file_path, revisions)
+    finally:
+        _thread_records.records = None
+    return records
+
 
 def apply_edits(json_data, vale_dir=".vale"):
     """
     Apply edits to Markdown per Check key in Vale JSON file
-        1. Opens Markdown file
+        1. Opens Markdown files (concurrently, on a small thread pool)
         2. Apply local, index-based edits in reverse order (ascending, right-to-left)
         3. Apply global line edits (whitespace)
-        4. Overwrite original file
+        4. Overwrite original file atomically (only if revised)
 
     Parameters:
         json_data -- contents of Vale JSON output file (parsed dictionary)
         vale_dir (str) -- path to .vale dir (parent of "style" subdir)
     """
 
-    # variables for rules
-    # EX: "Google.Spacing"
-    whitespace_rule = "style.rule"
-    eol_rule = "style.rule"
-    contraction_rule = "style.rule"
-    special_words_rule = "style.rule" # EX: "Google.WordList"
-    head_punct_rule = "style.rule"
-    head_case_rule = "style.rule"
-    # path to Headings.yml with exceptions list header sentence-style casing
-    # EX: .vale/style/Google/Headers.yml
-    exceptions_yml = '.vale/style/styleguide/rule.yml'
-
-    # GLOBAL = edit modifies whole line
-    GLOBAL_RULES = {
-        whitespace_rule,
-        eol_rule}
-    # SPAN = edit modifies only content with index span
-    SPAN_RULES = {
-        contraction_rule,
-        special_words_rule,
-        head_punct_rule,
-        head_case_rule
-    }
-
-    # dict to match .yml rule (key) with edit function (value)
-    edit_functions = {
-        whitespace_rule: edit_spacing,
-        eol_rule: edit_eol_whitespace,
-        contraction_rule: edit_contractions,
-        special_words_rule: edit_special_words,
-        head_punct_rule: edit_header_punct,
-        head_case_rule: edit_headcase
-    }
-
+    # merge entries naming the same file so no two threads write it
+    by_path = {}
     for file_path, revisions in json_data.items():
-        print(f"\nEditing file {file_path}")
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.readlines()
-        except FileNotFoundError:
-            print(f"\tUnable to find {file_path}. Skipping.")
-            continue
-        except Exception:
-            print(f"\tUnable to read {file_path}. Skipping.")
-            continue
+        _, merged = by_path.setdefault(os.path.realpath(file_path), (file_path, []))
+        merged.extend(revisions)
 
-        revisions_by_line = defaultdict(list)
-        for revision in revisions:
-            line_num = revision.get("Line")
-            if line_num is None: continue
-            revisions_by_line[line_num - 1].append(revision) # 0-based index
+    if not by_path:
+        return
+    file_paths = [file_path for file_path, _ in by_path.values()]
+    revisions = [merged for _, merged in by_path.values()]
 
-        lines_to_process = sorted(revisions_by_line.keys())
+    # file I/O releases the GIL, so files overlap on a small thread pool
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(by_path))) as executor:
+        for records in executor.map(_process_file_buffered, file_paths, revisions):
+            for record in records:
+                log.handle(record)
 
-        for line_num in lines_to_process:
-            if line_num < 0 or line_num >= len(content):
-                print(f"\t\tUnable to find line {line_num + 1}. Skipping.")
-                continue
 
-            line_revisions = revisions_by_line[line_num]
-            current_line = content[line_num]
-
-            print(f"\tEditing line {line_num + 1}:")
-
-            # separate revision rules span vs. global per JSON "Check" key
-            span_checks = []
-            global_checks = set()
-            for revision in line_revisions:
-                 check = revision.get("Check")
-                 if check in SPAN_RULES:
-                     span_checks.append(revision)
-                 elif check in GLOBAL_RULES:
-                     global_checks.add(check)
-                 elif check:
-                    print(f"\t\tUnable to apply revisions for {check}. Skipping.")
-
-            # span revisions (the last shall be first)
-            span_checks.sort(key=lambda e: e.get("Span", [0, 0])[0], reverse=True)
-
-            for revision in span_checks:
-                check = revision.get("Check")
-                span = revision.get("Span")
-                if not span: continue
-
-                start, end = span
-                func = edit_functions.get(check)
-                if not func: continue
-
-                print(f"\t\tApply local revision {check} at {start}-{end}")
-                try:
-                    if check in [contraction_rule, special_words_rule]:
-                         action = revision.get("Action", {})
-                         params = action.get("Params")
-                         if params and len(params) > 0:
-                             replacement = params[0]
-                             current_line = func(current_line, start, end, replacement)
-                         else:
-                             print(f"\t\t\tMissing replacement Params for {check}. Skipping.")
-                    elif check == head_case_rule:
-                         current_line = func(current_line, start, end, exceptions_yml)
-                    else:
-                         current_line = func(current_line, start, end)
-                except IndexError:
-                     print(f"\t\t\tIndex out of bounds for {check} at {start}-{end}.")
-                except Exception as err:
-                    print(f"\t\t\tError for {check}: {err}")
-
-            # now global line revision
-            if whitespace_rule in global_checks:
-                print(f"\t\tApply global line revision {whitespace_rule}")
-                try:
-                    # dummy spans (0,0)
-                    current_line = edit_spacing(current_line, 0, 0)
-                except Exception as err:
-                    print(f"\t\t\tError for {whitespace_rule}: {err}")
-
-            if eol_rule in global_checks:
-                print(f"\t\tApply global line revision {eol_rule}")
-                try:
-                    # dummy spans (0,0)
-                    current_line = edit_eol_whitespace(current_line, 0, 0)
-                except Exception as err:
-                    print(f"\t\t\tError for {eol_rule}: {err}")
-
-            # line break check
-            if not current_line.endswith('\n') and content[line_num].endswith('\n'):
-                 content[line_num] = current_line + '\n'
-            else:
-                 content[line_num] = current_line
-
-        # write over original file
-        try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.writelines(content)
-            print(f"\tCompleted revisions for {file_path}")
-        except Exception as err:
-            print(f"\tError writing revisions to {file_path}: {err}")
+def _load_json(json_file):
+    """
+    Load Vale JSON output from a single bytes read
+    Parsed with orjson when installed, else json
+    """
+    with open(json_file, 'rb') as file:
+        data = file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 if __name__ == "__main__":
 
+    # per-revision detail only when requested
+    verbose = os.environ.get("VALE_EDIT_VERBOSE")
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(message)s")
 
     # path to vale JSON output
     json_file_path = 'vale_output.json'
@@ -318,8 +556,7 @@ if __name__ == "__main__":
     vale_dir = '.vale'
 
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as file:
-            json_data = json.load(file)
+        json_data = _load_json(json_file_path)
         apply_edits(json_data, vale_dir)
         print("\nRevisions complete.\n")
 